@@ -0,0 +1,193 @@
+"""Scraping helpers for the NBA mock draft board and the ESPN NCAA schedule.
+
+These live in their own module so the pooled HTTP session and the on-disk
+page cache survive Streamlit reruns: the main script body re-executes on
+every interaction, but imported modules do not.
+"""
+import io
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Shared HTTP session: pooled keep-alive connections plus retry with
+# backoff on transient 5xx, instead of a fresh TCP/TLS handshake per page.
+# The pool is sized past the schedule executor's fan-out so concurrent
+# scrapes never fall back to unpooled one-shot connections.
+POOL_SIZE = 16
+
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=POOL_SIZE,
+    pool_maxsize=POOL_SIZE,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+))
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0",
+    # br needs the brotli package installed; HTML compresses ~5x over the wire
+    "Accept-Encoding": "gzip, deflate, br",
+})
+
+# On-disk page cache so app restarts within the TTL don't re-hit the
+# sources (st.cache_data only lives as long as the Streamlit process)
+CACHE_DIR = Path(".cache")
+CACHE_TTL = 1800  # seconds, matches the st.cache_data ttl
+
+# Shared worker pool for scrape fan-out, created once per process instead
+# of building and tearing down threads on every scrape
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+class DomainLimiter:
+    """Enforce a minimum spacing between requests to the same host.
+
+    Shared by all worker threads so the parallel fan-out stays polite to
+    ESPN instead of firing every request at once (and risking a 429).
+    """
+
+    def __init__(self, min_interval=0.25):
+        self.min_interval = min_interval
+        self._next_allowed = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        domain = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed[domain])
+            self._next_allowed[domain] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+LIMITER = DomainLimiter()
+
+
+def _write_atomic(path, data):
+    # Publish cache files via rename so a concurrent reader (another worker
+    # thread or a restarting process) never sees a half-written file
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def fetch_html(url, cache_key, ttl=CACHE_TTL):
+    # ttl=None means the cached copy never expires
+    path = CACHE_DIR / f"{cache_key}.html"
+    etag_path = CACHE_DIR / f"{cache_key}.etag"
+    cached = path.exists()
+    if cached and (ttl is None or time.time() - path.stat().st_mtime < ttl):
+        return path.read_bytes()
+
+    # Revalidate a stale copy instead of refetching: on 304 the server
+    # sends no body and we just restart the TTL clock
+    headers = {}
+    if cached and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+    LIMITER.wait(url)  # cache hits above never wait; only real fetches do
+    response = SESSION.get(url, headers=headers, timeout=10)
+    if response.status_code == 304:
+        path.touch()
+        return path.read_bytes()
+    response.raise_for_status()
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    _write_atomic(path, response.content)
+    etag = response.headers.get("ETag")
+    if etag:
+        _write_atomic(etag_path, etag.encode())
+    elif etag_path.exists():
+        etag_path.unlink()
+    return response.content
+
+
+# Only the draft tables matter on the mock-draft page; skip building the
+# rest of the DOM (nav, scripts, ads) entirely
+_TABLES_ONLY = SoupStrainer("table")
+
+
+# Function to scrape NBA draft board tables
+def scrape_nba_mock_draft(url):
+    html = fetch_html(url, "mock_draft")
+    soup = BeautifulSoup(html, "lxml", parse_only=_TABLES_ONLY)
+
+    # One selector covering both tables: a single C-level traversal instead
+    # of separate find/tbody/find_all walks per table
+    rows = soup.select(
+        "#nba_mock_consensus_table tbody tr, #nba_mock_consensus_table2 tbody tr"
+    )
+    all_data = [
+        [col.get_text(strip=True) for col in row.find_all("td")]
+        for row in rows
+    ]
+
+    df = pd.DataFrame(all_data)  # Create DataFrame from combined data
+    # Assign column names (assuming they are the same for both tables)
+    df.columns = ["Rank", "Team", "Player", "H", "W", "P", "School", "C"]
+    return df
+
+
+# Function to scrape the schedule table for a single date
+def scrape_single_date(single_date):
+    date_str = single_date.strftime("%Y%m%d")
+    url = f"https://www.espn.com/mens-college-basketball/schedule/_/date/{date_str}"
+    # Past days' schedules never change, so their cached pages never expire
+    ttl = None if single_date < date.today() else CACHE_TTL
+    html = fetch_html(url, date_str, ttl=ttl)
+
+    # Parsed frames are cached as Feather beside the HTML (dtypes survive,
+    # unlike CSV); a copy at least as new as the page skips the parse
+    feather_path = CACHE_DIR / f"{date_str}.feather"
+    html_path = CACHE_DIR / f"{date_str}.html"
+    if (feather_path.exists() and html_path.exists()
+            and feather_path.stat().st_mtime >= html_path.stat().st_mtime):
+        return pd.read_feather(feather_path)
+
+    # Only the first <table> is used, so slice its bytes out before parsing:
+    # lxml then sees ~30 KB of table instead of the full ~300 KB page
+    start = html.find(b"<table")
+    if start == -1:  # no table on the page means no games that day
+        return None
+    end = html.find(b"</table>", start)
+    table_html = html[start:end + len(b"</table>")] if end != -1 else html[start:]
+
+    # read_html does the whole table -> DataFrame conversion in lxml/C,
+    # including the header row, instead of a Python loop over every cell
+    try:
+        df = pd.read_html(io.BytesIO(table_html), flavor="lxml", header=0)[0]
+    except ValueError:
+        return None
+
+    if df.empty:
+        return None
+    df["DATE"] = single_date
+    feather_tmp = feather_path.with_suffix(".feather.tmp")
+    df.to_feather(feather_tmp)
+    feather_tmp.replace(feather_path)
+    return df
+
+
+# Function to scrape NCAA schedule
+def scrape_ncaa_schedule():
+    # The 7 days covered: yesterday through five days out
+    dates = [date.today() + timedelta(days=i - 1) for i in range(7)]
+
+    # The fetches are I/O-bound and independent, so run them in parallel;
+    # the threads share SESSION's connection pool. EXECUTOR.map keeps the
+    # results in date order.
+    results = list(EXECUTOR.map(scrape_single_date, dates))
+
+    frames = [df for df in results if df is not None]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)